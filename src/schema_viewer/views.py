@@ -1,15 +1,74 @@
+import functools
+import hashlib
+from collections import defaultdict
+from decimal import Decimal
+
+import orjson
 from django.apps import apps
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.shortcuts import render
 from django.db.models import Field
 from django.db.models.fields.related import (
     ForeignKey,
+    ForeignObjectRel,
     OneToOneField,
     ManyToManyField,
     ManyToOneRel,
     ManyToManyRel,
     OneToOneRel,
 )
+from django.utils.cache import get_conditional_response
+from django.utils.functional import Promise
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from django.views.decorators.gzip import gzip_page
+
+# Django's built-in apps, hidden unless exclude_django=false
+_DJANGO_APPS = frozenset(
+    {"admin", "auth", "contenttypes", "sessions", "messages", "staticfiles"}
+)
+
+# Relation field classes, most specific first so subclass lookups resolve
+# OneToOneField before its ForeignKey base (and likewise for the Rel classes).
+# ForeignObjectRel comes last to catch other reverse relations, such as the
+# GenericRel of a GenericRelation with a related_query_name.
+_FORWARD_REL = {
+    OneToOneField: "one_to_one",
+    ForeignKey: "foreign_key",
+    ManyToManyField: "many_to_many",
+}
+_REVERSE_REL = {
+    OneToOneRel: "one_to_one",
+    ManyToOneRel: "foreign_key",
+    ManyToManyRel: "many_to_many",
+    ForeignObjectRel: "foreign_key",
+}
+
+# Method wrappers stored in a class __dict__ that aren't callable until bound.
+# Django adds get_FOO_display() and get_next_by_FOO() as partialmethods.
+_METHOD_WRAPPERS = (classmethod, staticmethod, functools.partialmethod)
+
+# Field.get_internal_type() results, which depend only on the field class
+_internal_types: dict[type, str] = {}
+
+# Encoded get_model_info() output per (model, language), see _model_blob()
+_model_blobs: dict[tuple[type, str | None], bytes] = {}
+
+
+def _json_default(obj):
+    """Serialize the types orjson doesn't handle natively (lazy strings, Decimal)."""
+    if isinstance(obj, (Promise, Decimal)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json(data, status: int = 200) -> HttpResponse:
+    """Return an orjson-encoded JSON response."""
+    return HttpResponse(
+        orjson.dumps(data, default=_json_default),
+        status=status,
+        content_type="application/json",
+    )
 
 
 def index(request):
@@ -19,22 +78,27 @@ def index(request):
 
 def get_field_info(field: Field) -> dict:
     """Extract relevant information from a Django model field."""
+    field_cls = type(field)
+    internal_type = _internal_types.get(field_cls)
+    if internal_type is None:
+        internal_type = _internal_types[field_cls] = field.get_internal_type()
+
     info = {
         "name": field.name,
-        "type": field.get_internal_type(),
-        "verbose_name": str(field.verbose_name) if hasattr(field, "verbose_name") else None,
-        "help_text": str(field.help_text) if hasattr(field, "help_text") and field.help_text else None,
-        "primary_key": getattr(field, "primary_key", False),
-        "unique": getattr(field, "unique", False),
-        "null": getattr(field, "null", False),
-        "blank": getattr(field, "blank", False),
-        "db_index": getattr(field, "db_index", False),
-        "editable": getattr(field, "editable", True),
+        "type": internal_type,
+        "verbose_name": str(field.verbose_name),
+        "help_text": str(field.help_text) or None,
+        "primary_key": field.primary_key,
+        "unique": field.unique,
+        "null": field.null,
+        "blank": field.blank,
+        "db_index": field.db_index,
+        "editable": field.editable,
     }
 
     # Add default value if present
-    if hasattr(field, "default") and field.default is not None:
-        default = field.default
+    default = field.default
+    if default is not None:
         if callable(default):
             info["default"] = f"<callable: {default.__name__}>"
         elif default != field.empty_strings_allowed:
@@ -43,28 +107,44 @@ def get_field_info(field: Field) -> dict:
             except Exception:
                 info["default"] = "<complex default>"
 
-    # Add choices if present
-    if hasattr(field, "choices") and field.choices:
-        info["choices"] = [
-            {"value": choice[0], "label": str(choice[1])}
-            for choice in field.choices
-        ]
+    # Add choices if present, as [value, label] pairs
+    if field.choices:
+        info["choices"] = [(value, str(label)) for value, label in field.choices]
 
     # Add max_length for char fields
-    if hasattr(field, "max_length") and field.max_length:
+    if field.max_length:
         info["max_length"] = field.max_length
 
     return info
 
 
+@functools.cache
+def _relation_kind(field_cls: type) -> tuple[str, str] | None:
+    """Classify a field class as ``(direction, rel_type)``, or None if unrelated."""
+    for direction, table in (("forward", _FORWARD_REL), ("reverse", _REVERSE_REL)):
+        rel_type = table.get(field_cls)
+        if rel_type is None:
+            # Custom subclasses of the relation fields are rare; fall back to the MRO
+            rel_type = next(
+                (name for cls, name in table.items() if issubclass(field_cls, cls)),
+                None,
+            )
+        if rel_type is not None:
+            return direction, rel_type
+    return None
+
+
 def get_relationship_info(field) -> dict | None:
     """Extract relationship information from a relational field."""
+    kind = _relation_kind(type(field))
+    if kind is None:
+        return None
+    direction, rel_type = kind
+
     # Forward relations
-    if isinstance(field, (ForeignKey, OneToOneField, ManyToManyField)):
+    if direction == "forward":
         related_model = field.related_model
-        rel_type = "many_to_many" if isinstance(field, ManyToManyField) else \
-                   "one_to_one" if isinstance(field, OneToOneField) else "foreign_key"
-        
+
         info = {
             "name": field.name,
             "type": rel_type,
@@ -72,42 +152,108 @@ def get_relationship_info(field) -> dict | None:
             "target_app": related_model._meta.app_label,
             "target_model": related_model._meta.model_name,
             "related_name": field.remote_field.related_name or f"{field.model._meta.model_name}_set",
-            "null": getattr(field, "null", False),
+            "null": field.null,
             "on_delete": str(field.remote_field.on_delete.__name__) if hasattr(field.remote_field, "on_delete") and field.remote_field.on_delete else None,
         }
 
-        # Add through model for M2M
-        if isinstance(field, ManyToManyField):
+        # Add through model for M2M. Auto-created through models (the common
+        # case) store their owning model in auto_created, so only an explicit
+        # through model has auto_created set to False.
+        if field.many_to_many:
             through = field.remote_field.through
-            if through and not through._meta.auto_created:
+            if through is not None and through._meta.auto_created is False:
+                through_meta = through._meta
                 info["through"] = {
-                    "app": through._meta.app_label,
-                    "model": through._meta.model_name,
+                    "app": through_meta.app_label,
+                    "model": through_meta.model_name,
                 }
 
         return info
 
     # Reverse relations
-    if isinstance(field, (ManyToOneRel, ManyToManyRel, OneToOneRel)):
-        rel_type = "many_to_many" if isinstance(field, ManyToManyRel) else \
-                   "one_to_one" if isinstance(field, OneToOneRel) else "foreign_key"
-        
-        return {
-            "name": field.name or field.get_accessor_name(),
-            "type": rel_type,
-            "direction": "reverse",
-            "target_app": field.related_model._meta.app_label,
-            "target_model": field.related_model._meta.model_name,
-            "field_name": field.field.name,
+    return {
+        "name": field.name or field.get_accessor_name(),
+        "type": rel_type,
+        "direction": "reverse",
+        "target_app": field.related_model._meta.app_label,
+        "target_model": field.related_model._meta.model_name,
+        "field_name": field.field.name,
+    }
+
+
+def _get_field_details(meta) -> dict:
+    """Collect the fields, relationships, indexes and constraints of a model."""
+    # A single pass over get_fields() (cached by Django) keeps its ordering:
+    # reverse relations, then parents' fields, then local and private fields
+    # such as GenericForeignKey and GenericRelation.
+    fields = []
+    relationships = []
+    for field in meta.get_fields():
+        rel_info = get_relationship_info(field)
+        if rel_info is not None:
+            relationships.append(rel_info)
+        elif isinstance(field, Field):
+            # Only real Fields define the attributes get_field_info reads
+            fields.append(get_field_info(field))
+
+    # Indexes
+    indexes = [
+        {
+            "name": index.name,
+            "fields": tuple(index.fields),
         }
+        for index in meta.indexes
+    ]
 
-    return None
+    # Unique constraints
+    constraints = [
+        {
+            "name": constraint.name,
+            "type": constraint.__class__.__name__,
+        }
+        for constraint in meta.constraints
+    ]
 
+    return {
+        "fields": fields,
+        "relationships": relationships,
+        **({"indexes": indexes} if indexes else {}),
+        **({"constraints": constraints} if constraints else {}),
+        # Unique together (legacy)
+        **({"unique_together": meta.unique_together} if meta.unique_together else {}),
+    }
+
+
+def get_model_info(
+    model, include_fields: bool = True, app_verbose: dict[str, str] | None = None
+) -> dict:
+    """
+    Extract comprehensive information about a Django model.
+
+    Model metadata is fixed once the app registry is ready, so the result is
+    cached on the model class, per active language since verbose names and
+    help text are lazy translations. Callers must not mutate the returned dict.
+
+    ``app_verbose`` optionally maps app labels to verbose names so callers
+    handling many models can skip the per-model app registry lookup.
+    """
+    # Read from the class __dict__ so child models don't pick up a parent's cache
+    key = (include_fields, get_language())
+    cache = model.__dict__.get("_schema_cache")
+    if cache is None:
+        cache = {}
+        model._schema_cache = cache
+    elif key in cache:
+        return cache[key]
 
-def get_model_info(model, include_fields: bool = True) -> dict:
-    """Extract comprehensive information about a Django model."""
     meta = model._meta
 
+    # Inheritance info
+    parents = [
+        {"app": parent._meta.app_label, "model": parent._meta.model_name}
+        for parent in meta.parents
+    ]
+
     info = {
         "app_label": meta.app_label,
         "model_name": meta.model_name,
@@ -117,130 +263,165 @@ def get_model_info(model, include_fields: bool = True) -> dict:
         "abstract": meta.abstract,
         "proxy": meta.proxy,
         "managed": meta.managed,
-        "app_config": apps.get_app_config(meta.app_label).verbose_name,
+        "app_config": (
+            app_verbose[meta.app_label]
+            if app_verbose is not None
+            else apps.get_app_config(meta.app_label).verbose_name
+        ),
+        **({"parents": parents} if parents else {}),
+        **(_get_field_details(meta) if include_fields else {}),
     }
 
-    # Inheritance info
-    if meta.parents:
-        info["parents"] = [
-            {"app": parent._meta.app_label, "model": parent._meta.model_name}
-            for parent in meta.parents.keys()
-        ]
-
-    if include_fields:
-        # Get all fields (excluding reverse relations for the basic list)
-        fields = []
-        relationships = []
-
-        for field in meta.get_fields():
-            rel_info = get_relationship_info(field)
-            if rel_info:
-                relationships.append(rel_info)
-            elif hasattr(field, "get_internal_type"):
-                fields.append(get_field_info(field))
-
-        info["fields"] = fields
-        info["relationships"] = relationships
-
-        # Indexes
-        if meta.indexes:
-            info["indexes"] = [
-                {
-                    "name": index.name,
-                    "fields": list(index.fields),
-                }
-                for index in meta.indexes
-            ]
-
-        # Unique constraints
-        if meta.constraints:
-            info["constraints"] = [
-                {
-                    "name": constraint.name,
-                    "type": constraint.__class__.__name__,
-                }
-                for constraint in meta.constraints
-            ]
+    cache[key] = info
+    return info
 
-        # Unique together (legacy)
-        if meta.unique_together:
-            info["unique_together"] = [list(ut) for ut in meta.unique_together]
 
-    return info
+def clear_schema_cache():
+    """Drop all cached model info and serialized schemas."""
+    for model in apps.get_models(include_auto_created=True):
+        model.__dict__.get("_schema_cache", {}).clear()
+    _model_blobs.clear()
+    _build_schema.cache_clear()
+    _build_model_detail.cache_clear()
 
 
-def schema_api(request):
-    """
-    API endpoint that returns the full schema as JSON.
-    
-    Query parameters:
-        - exclude_django: Exclude Django's built-in models (default: true)
-        - apps: Comma-separated list of app labels to include
-    """
-    exclude_django = request.GET.get("exclude_django", "true").lower() == "true"
-    include_apps = request.GET.get("apps", "").split(",") if request.GET.get("apps") else None
+def _model_blob(model, app_verbose: dict[str, str] | None = None) -> bytes:
+    """Return the serialized model info, encoding it once per model and language."""
+    key = (model, get_language())
+    blob = _model_blobs.get(key)
+    if blob is None:
+        info = get_model_info(model, include_fields=True, app_verbose=app_verbose)
+        blob = _model_blobs[key] = orjson.dumps(info, default=_json_default)
+    return blob
+
 
-    django_apps = {"admin", "auth", "contenttypes", "sessions", "messages", "staticfiles"}
+def _iter_schema(exclude_django: bool, include_apps: frozenset[str] | None):
+    """
+    Yield the schema JSON in fragments, one app at a time.
 
-    schema = {"apps": {}}
+    Each app is framed around the pre-encoded model blobs, so filter
+    combinations that share models don't re-serialize them.
+    """
+    models_by_app = defaultdict(list)
 
     for model in apps.get_models():
         app_label = model._meta.app_label
 
         # Filter by app if specified
-        if include_apps and app_label not in include_apps:
+        if include_apps is not None and app_label not in include_apps:
             continue
 
         # Exclude Django built-in apps if requested
-        if exclude_django and app_label in django_apps:
+        if exclude_django and app_label in _DJANGO_APPS:
             continue
 
         # Skip abstract models (they won't appear in get_models anyway, but just in case)
         if model._meta.abstract:
             continue
 
-        # Initialize app in schema if needed
-        if app_label not in schema["apps"]:
-            app_config = apps.get_app_config(app_label)
-            schema["apps"][app_label] = {
-                "verbose_name": app_config.verbose_name,
-                "models": {},
-            }
+        models_by_app[app_label].append(model)
 
-        # Add model to schema (without full field details for overview)
-        model_info = get_model_info(model, include_fields=True)
-        schema["apps"][app_label]["models"][model._meta.model_name] = model_info
+    app_verbose = {
+        app_config.label: str(app_config.verbose_name)
+        for app_config in apps.get_app_configs()
+    }
 
-    return JsonResponse(schema)
+    yield b'{"apps":{'
+    for i, (app_label, app_models) in enumerate(models_by_app.items()):
+        if i:
+            yield b","
+        models = b",".join(
+            orjson.dumps(model._meta.model_name)
+            + b":"
+            + _model_blob(model, app_verbose)
+            for model in app_models
+        )
+        yield (
+            orjson.dumps(app_label)
+            + b':{"verbose_name":'
+            + orjson.dumps(app_verbose[app_label])
+            + b',"models":{'
+            + models
+            + b"}}"
+        )
+    yield b"}}"
+
+
+def _etag(payload: bytes) -> str:
+    """Compute a quoted ETag for an encoded payload."""
+    return quote_etag(hashlib.md5(payload, usedforsecurity=False).hexdigest())
+
+
+def _cached_json(request, payload: bytes, etag: str) -> HttpResponse:
+    """
+    Return a JSON response for a precomputed payload, or 304 Not Modified if
+    the client's If-None-Match already matches its ETag.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(payload, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, max-age=60"
+    return response
+
+
+@functools.lru_cache(maxsize=32)
+def _build_schema(
+    exclude_django: bool, include_apps: frozenset[str] | None, language: str | None
+) -> tuple[bytes, str]:
+    """
+    Build and serialize the schema for a given filter combination.
 
+    The model registry doesn't change once Django has started, so the encoded
+    payload and its ETag are cached for the lifetime of the process. The
+    active language is part of the key because verbose names are translated.
+    """
+    payload = b"".join(_iter_schema(exclude_django, include_apps))
+    return payload, _etag(payload)
 
-def model_detail_api(request, app_label: str, model_name: str):
+
+@gzip_page
+def schema_api(request):
     """
-    API endpoint for detailed information about a specific model.
+    API endpoint that returns the full schema as JSON.
+
+    Responses carry an ETag; requests with a matching If-None-Match header
+    get a 304 Not Modified. Clients sending ``Accept-Encoding: gzip`` get a
+    compressed body with ``Content-Encoding: gzip``. Field choices are
+    emitted as ``[value, label]`` pairs.
+    
+    Query parameters:
+        - exclude_django: Exclude Django's built-in models (default: true)
+        - apps: Comma-separated list of app labels to include
     """
-    try:
-        model = apps.get_model(app_label, model_name)
-    except LookupError:
-        return JsonResponse({"error": "Model not found"}, status=404)
+    exclude_django = request.GET.get("exclude_django", "true").lower() == "true"
+    # A frozenset gives O(1) membership and doubles as an order-insensitive cache key
+    raw_apps = request.GET.get("apps", "")
+    include_apps = frozenset(filter(None, raw_apps.split(","))) or None
+
+    payload, etag = _build_schema(exclude_django, include_apps, get_language())
+    return _cached_json(request, payload, etag)
+
 
-    info = get_model_info(model, include_fields=True)
+@functools.cache
+def _build_model_detail(model, language: str | None) -> tuple[bytes, str]:
+    """Build and serialize the detail view of a model, cached like the schema."""
+    # Copy so the extra keys below don't leak into the cached model info
+    info = dict(get_model_info(model, include_fields=True))
 
     # Add additional details for the detail view
     meta = model._meta
 
-    # Get model methods (excluding dunder methods and private methods)
-    methods = []
-    for name in dir(model):
-        if name.startswith("_"):
-            continue
-        attr = getattr(model, name, None)
-        if callable(attr) and not isinstance(attr, type):
-            try:
-                # Check if it's defined on this model, not inherited from Model
-                if name in model.__dict__:
-                    methods.append({"name": name})
-            except Exception:
-                pass
+    # Get model methods defined on this model (excluding dunder and private methods).
+    # Reading the class __dict__ avoids dir()'s MRO walk and doesn't trigger
+    # descriptors such as managers or related accessors.
+    methods = [
+        {"name": name}
+        for name, attr in sorted(vars(model).items())
+        if not name.startswith("_")
+        and not isinstance(attr, type)
+        and (callable(attr) or isinstance(attr, _METHOD_WRAPPERS))
+    ]
 
     if methods:
         info["methods"] = methods
@@ -253,4 +434,22 @@ def model_detail_api(request, app_label: str, model_name: str):
     if managers:
         info["managers"] = managers
 
-    return JsonResponse(info)
+    payload = orjson.dumps(info, default=_json_default)
+    return payload, _etag(payload)
+
+
+@gzip_page
+def model_detail_api(request, app_label: str, model_name: str):
+    """
+    API endpoint for detailed information about a specific model.
+
+    Supports ETag / If-None-Match revalidation and gzip compression like
+    schema_api.
+    """
+    try:
+        model = apps.get_model(app_label, model_name)
+    except LookupError:
+        return _json({"error": "Model not found"}, status=404)
+
+    payload, etag = _build_model_detail(model, get_language())
+    return _cached_json(request, payload, etag)
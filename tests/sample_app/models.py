@@ -1,5 +1,7 @@
 """Sample models demonstrating various Django model features."""
 
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 
@@ -154,3 +156,48 @@ class BookDetail(models.Model):
 
     def __str__(self):
         return f"Details for {self.book}"
+
+
+class Tag(models.Model):
+    """A tag that can be attached to any model via a generic foreign key."""
+
+    label = models.CharField(max_length=50)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    obj = GenericForeignKey("content_type", "object_id")
+
+    def __str__(self):
+        return self.label
+
+
+class Place(models.Model):
+    """A place, used as the parent of a multi-table inheritance chain."""
+
+    name = models.CharField(max_length=100)
+    owner = models.ForeignKey(
+        Author, on_delete=models.CASCADE, null=True, blank=True, related_name="places"
+    )
+    friends = models.ManyToManyField(Author, related_name="friend_places", blank=True)
+    tags = GenericRelation(Tag)
+
+    def __str__(self):
+        return self.name
+
+
+class Restaurant(Place):
+    """Multi-table inheritance child of Place."""
+
+    serves_pizza = models.BooleanField(default=False)
+
+    def __str__(self):
+        return f"Restaurant {self.name}"
+
+
+class Event(models.Model):
+    """An event whose tags are queryable from Tag via related_query_name."""
+
+    title = models.CharField(max_length=100)
+    tags = GenericRelation(Tag, related_query_name="event")
+
+    def __str__(self):
+        return self.title
@@ -1,7 +1,21 @@
 """Tests for django-schema-viewer."""
 
+import gzip
+import json
+
+import django
 import pytest
 from django.test import Client
+from django.utils import translation
+from django.utils.translation import get_language
+
+from schema_viewer.views import (
+    _build_schema,
+    _model_blobs,
+    clear_schema_cache,
+    get_model_info,
+)
+from tests.sample_app.models import Book
 
 
 @pytest.fixture
@@ -45,6 +59,62 @@ class TestSchemaAPI:
         data = response.json()
         assert "sample_app" in data["apps"]
 
+    def test_schema_api_through_only_for_explicit_models(self, client):
+        """Test that only explicit M2M through models are reported."""
+        response = client.get("/__schema/api/schema/")
+        data = response.json()
+        book_model = data["apps"]["sample_app"]["models"]["book"]
+        rels = {r["name"]: r for r in book_model["relationships"]}
+        assert rels["authors"]["through"] == {
+            "app": "sample_app",
+            "model": "bookauthor",
+        }
+        assert "through" not in rels["categories"]
+
+    def test_schema_api_includes_generic_relations(self, client):
+        """Test that private fields such as GenericRelation are listed."""
+        response = client.get("/__schema/api/schema/")
+        models = response.json()["apps"]["sample_app"]["models"]
+        for model_name in ("place", "restaurant"):
+            field_names = [f["name"] for f in models[model_name]["fields"]]
+            assert field_names[-1] == "tags"
+
+    def test_schema_api_generic_relation_reverse(self, client):
+        """Test that a queryable GenericRelation shows up as a reverse relation."""
+        response = client.get("/__schema/api/schema/")
+        assert response.status_code == 200
+        tag = response.json()["apps"]["sample_app"]["models"]["tag"]
+        rels = {r["name"]: r for r in tag["relationships"]}
+        assert rels["event"]["direction"] == "reverse"
+        assert rels["event"]["target_model"] == "event"
+        assert rels["event"]["field_name"] == "tags"
+        assert "event" not in [f["name"] for f in tag["fields"]]
+
+    @pytest.mark.skipif(
+        django.VERSION < (5, 1), reason="GenericForeignKey is a Field since 5.1"
+    )
+    def test_schema_api_includes_generic_foreign_key(self, client):
+        """Test that a GenericForeignKey is listed with the fields."""
+        response = client.get("/__schema/api/schema/")
+        tag = response.json()["apps"]["sample_app"]["models"]["tag"]
+        assert [f["name"] for f in tag["fields"]] == ["id", "label", "object_id", "obj"]
+
+    def test_schema_api_inherited_relationship_order(self, client):
+        """Test that MTI children list parent relations before the parent link."""
+        response = client.get("/__schema/api/schema/")
+        restaurant = response.json()["apps"]["sample_app"]["models"]["restaurant"]
+        rel_names = [r["name"] for r in restaurant["relationships"]]
+        assert rel_names == ["owner", "friends", "place_ptr"]
+        assert restaurant["parents"] == [{"app": "sample_app", "model": "place"}]
+
+    def test_schema_api_includes_app_verbose_name(self, client):
+        """Test that app verbose names are set on apps and their models."""
+        response = client.get("/__schema/api/schema/")
+        data = response.json()
+        sample_app = data["apps"]["sample_app"]
+        assert sample_app["verbose_name"] == "Sample App"
+        assert sample_app["models"]["book"]["app_config"] == "Sample App"
+
     def test_schema_api_includes_model_fields(self, client):
         """Test that model fields are included."""
         response = client.get("/__schema/api/schema/")
@@ -55,6 +125,14 @@ class TestSchemaAPI:
         assert "title" in field_names
         assert "isbn" in field_names
 
+    def test_schema_api_includes_choices_as_pairs(self, client):
+        """Test that field choices are [value, label] pairs."""
+        response = client.get("/__schema/api/schema/")
+        data = response.json()
+        book_model = data["apps"]["sample_app"]["models"]["book"]
+        status = next(f for f in book_model["fields"] if f["name"] == "status")
+        assert status["choices"][0] == ["draft", "Draft"]
+
     def test_schema_api_includes_relationships(self, client):
         """Test that relationships are included."""
         response = client.get("/__schema/api/schema/")
@@ -65,6 +143,134 @@ class TestSchemaAPI:
         assert "publisher" in rel_names
         assert "authors" in rel_names
 
+    def test_schema_api_relationship_types(self, client):
+        """Test that forward and reverse relationships are classified."""
+        response = client.get("/__schema/api/schema/")
+        data = response.json()
+        book_model = data["apps"]["sample_app"]["models"]["book"]
+        rels = {
+            r["name"]: (r["direction"], r["type"]) for r in book_model["relationships"]
+        }
+        assert rels["publisher"] == ("forward", "foreign_key")
+        assert rels["authors"] == ("forward", "many_to_many")
+        assert rels["detail"] == ("reverse", "one_to_one")
+        assert rels["reviews"] == ("reverse", "foreign_key")
+
+    def test_schema_api_includes_unique_together(self, client):
+        """Test that unique_together is emitted as nested arrays."""
+        response = client.get("/__schema/api/schema/")
+        data = response.json()
+        book_author = data["apps"]["sample_app"]["models"]["bookauthor"]
+        assert book_author["unique_together"] == [["book", "author", "role"]]
+
+    def test_schema_api_filters_by_apps(self, client):
+        """Test that the apps parameter limits the returned apps."""
+        response = client.get("/__schema/api/schema/?apps=auth&exclude_django=false")
+        data = response.json()
+        assert list(data["apps"]) == ["auth"]
+
+    def test_schema_api_unknown_app_returns_empty(self, client):
+        """Test that filtering to an unknown app still returns valid JSON."""
+        response = client.get("/__schema/api/schema/?apps=nonexistent")
+        assert response.json() == {"apps": {}}
+
+    def test_schema_api_sets_etag(self, client):
+        """Test that the schema API returns an ETag and cache headers."""
+        response = client.get("/__schema/api/schema/")
+        assert response["ETag"]
+        assert response["Cache-Control"] == "private, max-age=60"
+
+    def test_schema_api_not_modified(self, client):
+        """Test that a matching If-None-Match returns 304 with no body."""
+        etag = client.get("/__schema/api/schema/")["ETag"]
+        response = client.get("/__schema/api/schema/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+
+    def test_schema_api_etag_varies_with_query(self, client):
+        """Test that different filters produce different ETags."""
+        etag = client.get("/__schema/api/schema/")["ETag"]
+        response = client.get(
+            "/__schema/api/schema/?exclude_django=false", HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_schema_api_gzip(self, client):
+        """Test that the schema is compressed when the client accepts gzip."""
+        response = client.get("/__schema/api/schema/", HTTP_ACCEPT_ENCODING="gzip")
+        assert response["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.content))["apps"]
+
+    def test_schema_api_gzip_not_modified(self, client):
+        """Test that the weakened ETag of a gzipped response still revalidates."""
+        etag = client.get("/__schema/api/schema/", HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        response = client.get(
+            "/__schema/api/schema/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 304
+
+    def test_schema_api_cache_respects_language(self, client):
+        """Test that cached schemas are not shared across languages."""
+        url = "/__schema/api/schema/?apps=auth&exclude_django=false"
+        with translation.override("de"):
+            german = client.get(url)
+        with translation.override("en"):
+            english = client.get(url, HTTP_IF_NONE_MATCH=german["ETag"])
+        assert german.json()["apps"]["auth"]["models"]["user"]["verbose_name"] == (
+            "Benutzer"
+        )
+        assert english.status_code == 200
+        assert english.json()["apps"]["auth"]["models"]["user"]["verbose_name"] == (
+            "user"
+        )
+
+    def test_schema_api_caches_payload(self, client):
+        """Test that equivalent queries reuse the cached payload."""
+        clear_schema_cache()
+        client.get("/__schema/api/schema/?apps=sample_app,auth")
+        client.get("/__schema/api/schema/?apps=auth,sample_app")
+        info = _build_schema.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestModelInfoCache:
+    """Tests for the per-model info cache."""
+
+    def test_get_model_info_is_cached(self):
+        """Test that repeated calls return the cached dict."""
+        clear_schema_cache()
+        assert get_model_info(Book) is get_model_info(Book)
+
+    def test_clear_schema_cache(self):
+        """Test that clearing the cache forces a rebuild."""
+        info = get_model_info(Book)
+        clear_schema_cache()
+        assert get_model_info(Book) is not info
+
+    def test_model_blobs_shared_across_filters(self, client):
+        """Test that encoded models are reused by other filter combinations."""
+        clear_schema_cache()
+        client.get("/__schema/api/schema/?apps=sample_app")
+        blob = _model_blobs[Book, get_language()]
+        client.get("/__schema/api/schema/?exclude_django=false")
+        assert _model_blobs[Book, get_language()] is blob
+
+    def test_cached_indexes_do_not_alias_meta(self):
+        """Test that cached index fields are copies of Index.fields."""
+        index = get_model_info(Book)["indexes"][0]
+        assert isinstance(index["fields"], tuple)
+        assert index["fields"] is not Book._meta.indexes[0].fields
+
+    def test_detail_extras_do_not_leak_into_cache(self, client):
+        """Test that model detail additions don't modify the cached info."""
+        client.get("/__schema/api/model/sample_app/book/")
+        assert "managers" not in get_model_info(Book)
+
 
 @pytest.mark.django_db
 class TestModelDetailAPI:
@@ -81,6 +287,12 @@ class TestModelDetailAPI:
         response = client.get("/__schema/api/model/sample_app/nonexistent/")
         assert response.status_code == 404
 
+    def test_model_detail_404_returns_json_error(self, client):
+        """Test that the 404 response body is a JSON error object."""
+        response = client.get("/__schema/api/model/sample_app/nonexistent/")
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == {"error": "Model not found"}
+
     def test_model_detail_includes_meta_info(self, client):
         """Test that model meta information is included."""
         response = client.get("/__schema/api/model/sample_app/book/")
@@ -88,6 +300,36 @@ class TestModelDetailAPI:
         assert data["db_table"] == "sample_app_book"
         assert data["verbose_name"] == "book"
 
+    def test_model_detail_includes_methods(self, client):
+        """Test that methods defined on the model are listed."""
+        response = client.get("/__schema/api/model/sample_app/book/")
+        data = response.json()
+        method_names = [m["name"] for m in data["methods"]]
+        assert "get_status_display" in method_names
+        assert "objects" not in method_names
+        assert "DoesNotExist" not in method_names
+
+    def test_model_detail_not_modified(self, client):
+        """Test that model detail supports ETag revalidation."""
+        etag = client.get("/__schema/api/model/sample_app/book/")["ETag"]
+        response = client.get(
+            "/__schema/api/model/sample_app/book/", HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == 304
+
+    def test_model_detail_generic_relation_reverse(self, client):
+        """Test that models targeted by a queryable GenericRelation load."""
+        response = client.get("/__schema/api/model/sample_app/tag/")
+        assert response.status_code == 200
+
+    def test_model_detail_cache_respects_language(self, client):
+        """Test that cached model details are not shared across languages."""
+        url = "/__schema/api/model/auth/user/"
+        with translation.override("de"):
+            assert client.get(url).json()["verbose_name"] == "Benutzer"
+        with translation.override("en"):
+            assert client.get(url).json()["verbose_name"] == "user"
+
     def test_model_detail_includes_indexes(self, client):
         """Test that indexes are included."""
         response = client.get("/__schema/api/model/sample_app/book/")